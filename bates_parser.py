@@ -0,0 +1,242 @@
+import pandas as pd
+import numpy as np
+import csv
+import string
+from io import BytesIO
+from functools import lru_cache
+from operator import methodcaller
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    # Fall back to the pandas C engine when pyarrow is unavailable
+    pa = None
+
+# --- Configuration ---
+DELIMITER = 'þ'
+DELIMITER_BYTES = DELIMITER.encode('utf-8')
+BOM_BYTES = '\ufeff'.encode('utf-8')
+# 'þ' is two bytes in UTF-8, which neither pyarrow nor the pandas C engine accept
+# as a separator. '\x14' is stripped from the content before parsing, so it is
+# free to stand in for the delimiter.
+FIELD_SEPARATOR = '\x14'
+FIELD_SEPARATOR_BYTES = FIELD_SEPARATOR.encode('utf-8')
+# Block size for pyarrow's threaded reader: larger than its 1 MB default so
+# each column comes back in fewer chunks, while still splitting big files
+# across threads
+ARROW_BLOCK_SIZE = 4 * 1024 * 1024
+# Arrow-backed strings keep each column in one contiguous buffer instead of a
+# Python object per cell
+STRING_DTYPE = pd.StringDtype('pyarrow') if pa is not None else str
+
+# The definitive list of 28 core column headers, in the correct order.
+DEFINITIVE_HEADERS = [
+    'Bates Begin', 
+    'Bates End', 
+    'Bates Begin Attach', 
+    'Bates End Attach', 
+    'Attachment Document', 
+    'Pages', 
+    'Author', 
+    'Custodian/Source', 
+    'Date Created', 
+    'Date Last Modified', 
+    'Date Received', 
+    'Date Sent', 
+    'Time Sent', 
+    'Document Extension', 
+    'Email BCC', 
+    'Email CC', 
+    'Email From', 
+    'Email Subject/Title', 
+    'Email To', 
+    'Original Filename', 
+    'File Size', 
+    'Original Folder Path', 
+    'MD5 Hash', 
+    'Parent Document ID', 
+    'Document Title', 
+    'Time Zone', 
+    'Text Link', 
+    'Native Link' 
+]
+# The header row is located by its last column name, encoded once for searching
+# the raw bytes
+HEADER_MARKER = DEFINITIVE_HEADERS[-1].encode('utf-8')
+
+# Generic column names A..ZZ, built once at import
+COLUMN_NAMES = tuple(string.ascii_uppercase) + tuple(
+    first + second for first in string.ascii_uppercase for second in string.ascii_uppercase
+)
+
+@lru_cache(maxsize=16)
+def generate_column_names(n):
+    """
+    Generates column names A, B, C, ..., AA, AB, etc. Cached per width, so the
+    result is returned as a tuple that callers cannot modify.
+    """
+    names = list(COLUMN_NAMES[:n])
+    # Only files wider than ZZ need names built letter by letter
+    for i in range(len(names), n):
+        name = ""
+        temp_i = i
+        while temp_i >= 0:
+            name = string.ascii_uppercase[temp_i % 26] + name
+            temp_i = temp_i // 26 - 1
+        names.append(name)
+    return tuple(names)
+
+def read_with_c_engine(data, n_fields, start=0):
+    """Tokenizes data[start:] into `n_fields` string columns using the pandas C engine."""
+    buffer = BytesIO(data)
+    buffer.seek(start)
+    return pd.read_csv(
+        buffer,
+        sep=FIELD_SEPARATOR,
+        engine='c',
+        header=None,
+        names=range(n_fields),
+        dtype=STRING_DTYPE,
+        na_filter=False,
+        encoding='utf-8',
+    )
+
+def read_with_csv_module(data, start=0):
+    """
+    Tokenizes data[start:] line by line with csv.reader, as the viewer always
+    has. Used for ragged input containing '"' quotes: a quoted value spanning
+    lines is joined without the newline, and a quote that never closes runs
+    to the end of the file.
+    """
+    lines = data[start:].decode('utf-8').split('\n')
+    rows = [row for row in csv.reader(lines, delimiter=FIELD_SEPARATOR) if row]
+    # Pad every row to the widest one
+    n_fields = max(map(len, rows), default=0)
+    return pd.DataFrame(
+        [row + [''] * (n_fields - len(row)) for row in rows],
+        dtype=STRING_DTYPE,
+    )
+
+def read_delimited(data, start=0):
+    """
+    Tokenizes FIELD_SEPARATOR-delimited UTF-8 bytes from offset `start` into a
+    DataFrame of raw string cells, padding short rows with empty strings.
+    """
+    lines = BytesIO(data)
+    lines.seek(start)
+    first_row = next((line for line in lines if line.strip()), None)
+    if first_row is None:
+        return pd.DataFrame()
+    n_fields = first_row.count(FIELD_SEPARATOR_BYTES) + 1
+
+    if pa is not None:
+        column_names = [str(i) for i in range(n_fields)]
+        try:
+            table = pacsv.read_csv(
+                pa.BufferReader(pa.py_buffer(data)[start:]),
+                read_options=pacsv.ReadOptions(column_names=column_names, block_size=ARROW_BLOCK_SIZE),
+                parse_options=pacsv.ParseOptions(delimiter=FIELD_SEPARATOR),
+                convert_options=pacsv.ConvertOptions(
+                    column_types=dict.fromkeys(column_names, pa.string()),
+                    strings_can_be_null=False,
+                ),
+            )
+            # Keep one block per column rather than consolidating into a 2D array,
+            # releasing each Arrow buffer once its column is converted
+            return table.to_pandas(
+                split_blocks=True,
+                self_destruct=True,
+                types_mapper={pa.string(): STRING_DTYPE}.get,
+            )
+        except pa.ArrowInvalid:
+            # Rows have differing widths or a quote never closes; fall back below
+            pass
+
+    if data.find(b'"', start) >= 0:
+        # The C engine would need each row's width up front, which a quoted
+        # value spanning lines hides, and fails outright on an unclosed quote
+        return read_with_csv_module(data, start=start)
+
+    # Size the columns to the widest row so shorter rows are padded rather than rejected
+    separator_counts = map(methodcaller('count', FIELD_SEPARATOR_BYTES), lines)
+    n_fields = max(n_fields, max(separator_counts, default=0) + 1)
+
+    return read_with_c_engine(data, n_fields, start=start)
+
+def parse_data_from_content(file_content, use_fixed_headers=False):
+    """
+    Parses the raw UTF-8 file content (bytes) with a vectorized CSV reader
+    (pyarrow, or the pandas C engine as a fallback), and handles dynamic vs.
+    fixed headers.
+    """
+    # Remove Byte Order Mark (BOM) and non-standard separator \x14 globally. This
+    # works on the encoded bytes, since decoding to str only added full-size
+    # copies that were encoded straight back for the reader.
+    # Chained so the intermediate copy is freed before tokenizing, leaving only
+    # `data` alive next to the caller's bytes.
+    data = (
+        file_content.removeprefix(BOM_BYTES)
+        .translate(None, b'\x14')
+        .replace(DELIMITER_BYTES, FIELD_SEPARATOR_BYTES)
+    )
+    
+    # Find the start of the actual data rows: the line after the first one
+    # containing 'Native Link', located with a single search over the buffer
+    data_start = 0
+    header_pos = data.find(HEADER_MARKER)
+    if header_pos >= 0:
+        header_end = data.find(b'\n', header_pos)
+        data_start = len(data) if header_end < 0 else header_end + 1
+            
+    # Tokenize only the data lines by handing the readers that byte offset
+    df = read_delimited(data, start=data_start)
+    if df.empty:
+        return pd.DataFrame()
+
+    # A '"' quote left open across separators or lines makes the readers merge
+    # those fields, keeping the stand-in separator and the newline in the cell;
+    # put the original delimiter back and join the lines, as csv.reader did
+    restore_delimiter = b'"' in data
+    for column in df.columns:
+        values = df[column].str.strip()
+        if restore_delimiter:
+            values = values.str.replace(FIELD_SEPARATOR, DELIMITER, regex=False)
+            values = values.str.replace('\n', '', regex=False)
+        df[column] = values
+
+    # Remove the empty columns that result from the leading and trailing delimiter
+    if (df.iloc[:, 0] == '').all():
+        df = df.iloc[:, 1:]
+    if df.shape[1] and (df.iloc[:, -1] == '').all():
+        df = df.iloc[:, :-1]
+
+    max_cols = df.shape[1]
+    if max_cols == 0:
+        raise Exception("Failed to extract meaningful columns from data rows.")
+
+    # Create headers based on the desired mode
+    if use_fixed_headers and max_cols <= len(DEFINITIVE_HEADERS):
+        headers_to_use = DEFINITIVE_HEADERS[:max_cols]
+    else:
+        # Fallback to generic headers if the length is unexpected or fixed headers aren't used
+        headers_to_use = generate_column_names(max_cols)
+
+    df.columns = headers_to_use
+    
+    # Post-processing clean-up
+    if 'Pages' in df.columns:
+        # Nullable numbers show blanks for missing pages without the float ->
+        # fillna -> object round trip. Float page counts become Int64 only when
+        # every value is finite, whole and within int64 range; inf or overflowing
+        # values would otherwise be cast to a garbage integer.
+        pages = pd.to_numeric(df['Pages'], errors='coerce', dtype_backend='numpy_nullable')
+        if pages.dtype == 'Float64':
+            values = pages.dropna().to_numpy(dtype='float64')
+            is_int64 = np.isfinite(values) & (values == np.trunc(values))
+            is_int64 &= (values >= -2.0**63) & (values < 2.0**63)
+            if is_int64.all():
+                pages = pages.astype('Int64')
+        df['Pages'] = pages
+    
+    return df
@@ -0,0 +1,120 @@
+import os
+
+import pandas as pd
+import pytest
+
+import bates_parser
+from bates_parser import DEFINITIVE_HEADERS, parse_data_from_content
+
+BUNDLED_FILE = os.path.join(os.path.dirname(__file__), 'HOUSE_OVERSIGHT_009.dat')
+HEADER_LINE = 'þBegin Batesþ\x14þNative Linkþ\r\n'
+
+
+@pytest.fixture(params=['pyarrow', 'c-engine'])
+def reader(request, monkeypatch):
+    """Runs a test once through the pyarrow reader and once through the fallbacks."""
+    if request.param == 'pyarrow':
+        if bates_parser.pa is None:
+            pytest.skip('pyarrow is not installed')
+    else:
+        monkeypatch.setattr(bates_parser, 'pa', None)
+    return request.param
+
+
+def parse(text, use_fixed_headers=False):
+    return parse_data_from_content(text.encode('utf-8'), use_fixed_headers=use_fixed_headers)
+
+
+def rows(df):
+    return df.astype(object).values.tolist()
+
+
+def fixed_header_file(pages):
+    """Builds a 28-column file (no spacer columns) whose Pages cells hold `pages`."""
+    pages_index = DEFINITIVE_HEADERS.index('Pages')
+    lines = ['þ' + 'þ'.join(DEFINITIVE_HEADERS) + 'þ']
+    for value in pages:
+        cells = ['x'] * len(DEFINITIVE_HEADERS)
+        cells[pages_index] = value
+        lines.append('þ' + 'þ'.join(cells) + 'þ')
+    return '\n'.join(lines) + '\n'
+
+
+def test_bundled_file(reader):
+    with open(BUNDLED_FILE, 'rb') as f:
+        df = parse_data_from_content(f.read())
+    assert df.shape == (2897, 55)
+    assert list(df.columns[:3]) == ['A', 'B', 'C']
+    assert df.columns[-1] == 'BC'
+    assert rows(df.iloc[[0, -1], :3]) == [
+        ['HOUSE_OVERSIGHT_010477', '', 'HOUSE_OVERSIGHT_010485'],
+        ['HOUSE_OVERSIGHT_033599', '', 'HOUSE_OVERSIGHT_033600'],
+    ]
+
+
+def test_bundled_file_with_fixed_headers(reader):
+    with open(BUNDLED_FILE, 'rb') as f:
+        content = f.read().replace('þ\x14þ'.encode('utf-8'), 'þ'.encode('utf-8'))
+    df = parse_data_from_content(content, use_fixed_headers=True)
+    assert df.shape == (2897, 28)
+    assert list(df.columns) == DEFINITIVE_HEADERS
+    assert df['Pages'].dtype == 'Int64'
+    assert df['Pages'].head(5).tolist() == [pd.NA, 74, pd.NA, 43, 8]
+
+
+def test_ragged_rows_are_padded(reader):
+    df = parse(HEADER_LINE + 'þaþ\x14þbþ\r\nþcþ\r\nþdþ\x14þeþ\x14þfþ\r\n')
+    assert rows(df) == [['a', '', 'b', '', ''], ['c', '', '', '', ''], ['d', '', 'e', '', 'f']]
+
+
+def test_blank_lines_are_skipped(reader):
+    df = parse(HEADER_LINE + '\r\nþaþ\x14þbþ\r\n\r\n\r\nþcþ\x14þdþ\r\n')
+    assert rows(df) == [['a', '', 'b'], ['c', '', 'd']]
+
+
+def test_bom_and_missing_header(reader):
+    df = parse('\ufeffþ1þ\x14þ2þ\nþ3þ\x14þ4þ\n')
+    assert rows(df) == [['1', '', '2'], ['3', '', '4']]
+
+
+def test_empty_input(reader):
+    assert parse('').empty
+    assert parse(HEADER_LINE + '\r\n\r\n').empty
+
+
+def test_closed_quotes(reader):
+    df = parse(HEADER_LINE + 'þ"a, b"þ\x14þab"cþ\r\nþdþ\x14þeþ\r\n')
+    assert rows(df) == [['a, b', '', 'ab"c'], ['d', '', 'e']]
+
+
+def test_multiline_quote_is_joined(reader):
+    df = parse(HEADER_LINE + 'þ"multi\nline"þ\x14þbþ\nþcþ\x14þdþ\n')
+    assert rows(df) == [['multiline', '', 'b'], ['c', '', 'd']]
+
+
+def test_quote_across_separators_keeps_delimiter(reader):
+    df = parse(HEADER_LINE + 'þ"Projectþ\x14þxþ\nþa"þ\x14þbþ\n')
+    assert rows(df) == [['Projectþþxþþa', '', 'b']]
+
+
+def test_unterminated_quote_runs_to_end_of_file(reader):
+    df = parse(HEADER_LINE + 'þ"quoted\nnote"þ\x14þbþ\nþcþ\x14þdþ\nþ"unterminatedþ\x14þeþ\nþfþ\n')
+    assert rows(df) == [
+        ['quotednote', '', 'b'],
+        ['c', '', 'd'],
+        ['unterminatedþþeþþfþ', '', ''],
+    ]
+
+
+@pytest.mark.parametrize('pages, dtype, expected', [
+    (['3', '4', ''], 'Int64', [3, 4, pd.NA]),
+    (['3', '2.5'], 'Float64', [3.0, 2.5]),
+    (['3', 'inf'], 'Float64', [3.0, float('inf')]),
+    (['3', '1e400'], 'Float64', [3.0, float('inf')]),
+    (['3', '99999999999999999999'], 'Float64', [3.0, pytest.approx(1e20)]),
+    (['3', 'n/a'], 'Int64', [3, pd.NA]),
+])
+def test_pages(reader, pages, dtype, expected):
+    df = parse(fixed_header_file(pages), use_fixed_headers=True)
+    assert df['Pages'].dtype == dtype
+    assert df['Pages'].tolist() == expected